@@ -1,4 +1,5 @@
-from pydantic import BaseModel, Field
+from typing import List, Optional
+from pydantic import BaseModel, Field, model_validator
 
 class LLMConfig(BaseModel):
     provider: str
@@ -16,11 +17,27 @@ class ProcessingConfig(BaseModel):
     batch_size: int = 20
     comment_column: str = "Comments"
 
+class TaskConfig(BaseModel):
+    name: str = Field(description="Task name, used as the prefix for this task's output columns")
+    prompt_folder: str
+
 class AppConfig(BaseModel):
     input_file: str
     output_file: str
     input_encoding: str = "utf-8"
     output_encoding: str = "utf-8-sig"
-    prompt_folder: str
+    prompt_folder: Optional[str] = None
+    tasks: List[TaskConfig] = Field(default_factory=list)
     llm: LLMConfig
     processing: ProcessingConfig
+
+    @model_validator(mode="after")
+    def _check_tasks(self) -> "AppConfig":
+        if self.prompt_folder and self.tasks:
+            raise ValueError("Set either 'prompt_folder' or 'tasks', not both")
+        if not self.prompt_folder and not self.tasks:
+            raise ValueError("One of 'prompt_folder' or 'tasks' is required")
+        names = [task.name for task in self.tasks]
+        if len(names) != len(set(names)):
+            raise ValueError(f"Task names must be unique: {names}")
+        return self
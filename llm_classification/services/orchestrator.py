@@ -2,7 +2,7 @@ import os
 import pandas as pd
 import asyncio
 import logging
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from tqdm.asyncio import tqdm
 
 from ..models.config import AppConfig
@@ -16,14 +16,51 @@ from ..models.response import ClassificationResponse, BatchClassificationRespons
 
 logger = logging.getLogger(__name__)
 
+class ClassificationTask:
+    """
+    A single classification task backed by one prompt folder.
+
+    Holds the task's PromptManager, system prompt, response schema and the
+    mapping from LLM result fields to output columns.
+    """
+    RESULT_FIELDS = ("category", "reasoning", "language", "translation")
+
+    def __init__(self, prompt_folder: str, name: Optional[str] = None):
+        self.name = name
+        self.prompt_manager = PromptManager(prompt_folder)
+        self.system_prompt = self.prompt_manager.get_system_prompt()
+        self.valid_categories = self.prompt_manager.get_valid_categories()
+        self.schema = ClassificationResponse.model_json_schema()
+        self.batch_schema = BatchClassificationResponse.model_json_schema()
+
+        if name is None:
+            # Single-task runs keep the original output column names
+            self.columns = {field: field for field in self.RESULT_FIELDS}
+            self.columns["category"] = "grievance_category"
+        else:
+            self.columns = {field: f"{name}_{field}" for field in self.RESULT_FIELDS}
+
+    @property
+    def label(self) -> str:
+        return self.name or self.prompt_manager.prompt_folder
+
+    def to_columns(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Map an LLM result (or a partial one) onto this task's output columns."""
+        return {column: result.get(field) for field, column in self.columns.items()}
+
+
 class ClassificationOrchestrator:
     def __init__(self, config: AppConfig):
         self.config = config
-        self.prompt_manager = PromptManager(config.prompt_folder)
+        self.tasks = self._get_tasks()
         self.llm_client = self._get_llm_client()
-        self.system_prompt = self.prompt_manager.get_system_prompt()
+        # Shared by all tasks so the global concurrency budget is respected
         self.semaphore = asyncio.Semaphore(config.llm.max_concurrency)
-        self.valid_categories = self.prompt_manager.get_valid_categories()
+
+    def _get_tasks(self) -> List[ClassificationTask]:
+        if self.config.tasks:
+            return [ClassificationTask(task.prompt_folder, name=task.name) for task in self.config.tasks]
+        return [ClassificationTask(self.config.prompt_folder)]
 
     def _get_llm_client(self) -> BaseLLMClient:
         if self.config.llm.provider == "ollama":
@@ -49,43 +86,82 @@ class ClassificationOrchestrator:
             logger.error(f"Error checking output file: {e}")
             return 0
 
+    async def _classify_single_task(self, task: ClassificationTask, text: str) -> Dict[str, Any]:
+        async with self.semaphore:
+            result = await self.llm_client.aclassify(text, task.system_prompt, schema=task.schema)
+        return task.to_columns(result)
+
     async def _classify_single(self, row: pd.Series) -> Dict[str, Any]:
         text = str(row[self.config.processing.comment_column])
+        output = row.to_dict()
         
-        # Check for text quality issues
+        # Check for text quality issues (once, shared by all tasks)
         quality_issue = get_text_quality_issue(text)
         
         if quality_issue:
-            # ... skip logic ...
-            return {
-                **row.to_dict(),
-                "grievance_category": None,
-                "reasoning": f"skipped_{quality_issue}",
-                "language": None,
-                "translation": None
-            }
+            for task in self.tasks:
+                output.update(task.to_columns({"reasoning": f"skipped_{quality_issue}"}))
+            return output
 
-        async with self.semaphore:
-            # Get JSON schema from Pydantic model
-            schema = ClassificationResponse.model_json_schema()
-            result = await self.llm_client.aclassify(text, self.system_prompt, schema=schema)
-            # print(f"DEBUG LLM RESULT: {result}")
+        task_results = await asyncio.gather(
+            *(self._classify_single_task(task, text) for task in self.tasks)
+        )
+        for columns in task_results:
+            output.update(columns)
+        return output
+
+    async def _classify_task_batch(
+        self,
+        task: ClassificationTask,
+        formatted_input: str,
+        id_map: Dict[str, int],
+    ) -> Dict[int, Dict[str, Any]]:
+        """Run one task over a prepared batch. Returns row index -> task columns."""
+        results_map = {}
         
-        return {
-            **row.to_dict(),
-            "grievance_category": result.get("category"),
-            "reasoning": result.get("reasoning"),
-            "language": result.get("language"),
-            "translation": result.get("translation")
-        }
+        try:
+            async with self.semaphore:
+                llm_response = await self.llm_client.aclassify(formatted_input, task.system_prompt, schema=task.batch_schema)
+            
+            # Parse results
+            batch_results = llm_response.get("results", [])
+            
+            # Verify and Map back
+            for result in batch_results:
+                tid = str(result.get("id"))
+                if tid in id_map:
+                    results_map[id_map[tid]] = task.to_columns(result)
+                else:
+                    logger.warning(f"[{task.label}] Received unknown ID from LLM: {tid}")
+            
+            # Check for missing IDs (mismatch)
+            for tid, idx in id_map.items():
+                if idx not in results_map:
+                    logger.warning(f"[{task.label}] Missing result for ID: {tid}")
+                    results_map[idx] = task.to_columns({
+                        "category": "error",
+                        "reasoning": "Batch mismatch: ID missing in response"
+                    })
+                
+        except Exception as e:
+            logger.error(f"[{task.label}] Batch failure: {e}")
+            # Mark all valid inputs as error for safety
+            for tid, idx in id_map.items():
+                if idx not in results_map:
+                    results_map[idx] = task.to_columns({
+                        "category": "error",
+                        "reasoning": f"Batch processing failed: {str(e)}"
+                    })
+        
+        return results_map
 
     async def _classify_batch(self, rows: List[pd.Series]) -> List[Dict[str, Any]]:
         batch_inputs = []
         # Map TicketNumber -> Original Row Index
         id_map = {}
-        results_map = {}
+        results_map = {idx: row.to_dict() for idx, row in enumerate(rows)}
         
-        # 1. First pass: Filter mojibake/empty and prepare inputs
+        # 1. First pass: Filter mojibake/empty and prepare inputs (shared by all tasks)
         for idx, row in enumerate(rows):
             text = str(row[self.config.processing.comment_column])
             ticket_id = str(row["TicketNumber"]) # Assume TicketNumber exists per user request
@@ -94,84 +170,29 @@ class ClassificationOrchestrator:
             
             if quality_issue:
                 # Mark skipped immediately
-                results_map[idx] = {
-                    **row.to_dict(),
-                    "grievance_category": None,
-                    "reasoning": f"skipped_{quality_issue}",
-                    "language": None,
-                    "translation": None
-                }
+                for task in self.tasks:
+                    results_map[idx].update(task.to_columns({"reasoning": f"skipped_{quality_issue}"}))
             else:
                 batch_inputs.append((ticket_id, text))
                 id_map[ticket_id] = idx
         
-        # 2. Call LLM for valid inputs
+        # 2. Call LLM for valid inputs, one request per task, interleaved under the shared semaphore
         if batch_inputs:
             formatted_input = "\n".join([f"ID: {tid}\nComment: {text}\n" for tid, text in batch_inputs])
             
-            try:
-                # Get schema for BATCH response
-                schema = BatchClassificationResponse.model_json_schema()
-                
-                async with self.semaphore:
-                    llm_response = await self.llm_client.aclassify(formatted_input, self.system_prompt, schema=schema)
-                
-                # Parse results
-                batch_results = llm_response.get("results", [])
-                
-                # Verify and Map back
-                processed_ids = set()
-                
-                for result in batch_results:
-                    tid = str(result.get("id"))
-                    if tid in id_map:
-                        idx = id_map[tid]
-                        results_map[idx] = {
-                            **rows[idx].to_dict(),
-                            "grievance_category": result.get("category"),
-                            "reasoning": result.get("reasoning"),
-                            "language": result.get("language"),
-                            "translation": result.get("translation")
-                        }
-                        processed_ids.add(tid)
-                    else:
-                        logger.warning(f"Received unknown ID from LLM: {tid}")
-                
-                # Check for missing IDs (mismatch)
-                for tid, _ in batch_inputs:
-                    if tid not in processed_ids:
-                        idx = id_map[tid]
-                        logger.warning(f"Missing result for ID: {tid}")
-                        results_map[idx] = {
-                             **rows[idx].to_dict(),
-                            "grievance_category": "error",
-                            "reasoning": "Batch mismatch: ID missing in response",
-                             "language": None,
-                            "translation": None
-                        }
-                    
-            except Exception as e:
-                logger.error(f"Batch failure: {e}")
-                # Mark all valid inputs as error for safety
-                for tid, idx in id_map.items():
-                     if idx not in results_map:
-                        results_map[idx] = {
-                            **rows[idx].to_dict(),
-                            "grievance_category": "error",
-                            "reasoning": f"Batch processing failed: {str(e)}",
-                             "language": None,
-                            "translation": None
-                        }
+            task_results = await asyncio.gather(
+                *(self._classify_task_batch(task, formatted_input, id_map) for task in self.tasks)
+            )
+            for task_map in task_results:
+                for idx, columns in task_map.items():
+                    results_map[idx].update(columns)
 
         # 3. Construct final list in order
-        final_results = []
-        for i in range(len(rows)):
-            final_results.append(results_map[i])
-            
-        return final_results
+        return [results_map[i] for i in range(len(rows))]
 
     async def run(self):
         logger.info(f"Starting classification. Input: {self.config.input_file}")
+        logger.info(f"Tasks: {', '.join(task.label for task in self.tasks)}")
         
         processed_count = self._get_processed_count()
         logger.info(f"Resuming from row {processed_count}")